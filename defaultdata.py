@@ -4,21 +4,173 @@ import sys
 import re
 import json
 import argparse
-import datetime
+import codecs
+import time
 import hashlib
+import math
+import concurrent.futures
+import functools
+import threading
+from collections import defaultdict
 
 try:
     import yaml
+    # Prefer the libyaml-backed C loader when PyYAML was built with it.
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
 except ImportError:
     yaml = None
+    _YamlLoader = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Regex patterns for file types, compiled once at import time. \Z (not $) so a
+# trailing newline in a file name is not accepted.
+_SOURCE_RE  = re.compile(r'^(?P<inv>[A-Za-z0-9_]+)-source\..+\Z')
+_RAW_RE     = re.compile(r'^(?P<inv>[A-Za-z0-9_]+)-raw\..+\Z')
+_TIDY_RE    = re.compile(r'^(?P<inv>[A-Za-z0-9_]+)\.tsv\Z')
+_SIDECAR_RE = re.compile(r'^(?P<inv>[A-Za-z0-9_]+)\.yml\Z')
+_INV_NAME_RE = re.compile(r"[A-Za-z0-9_]+")
+
+# Bytes read per call, and at most in total, when sniffing a tidy file's header line.
+_TIDY_SNIFF_SIZE = 1 << 16  # 64 KiB
+_TIDY_SNIFF_LIMIT = 1 << 20  # 1 MiB
+# Line terminators recognised by universal newlines ('\n', '\r' and '\r\n').
+_LINE_END_RE = re.compile(rb"[\r\n]")
+
+# Read size used when hashing data files.
+_HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Per-project cache of file hashes, reused by `package` while a file's size and
+# mtime are unchanged. Delete it to force every file to be re-hashed.
+HASH_CACHE_FILE = ".datapackage.cache.json"
+# Entries whose mtime is this close to (or after) the time the cache is written
+# are not stored: a same-size rewrite within the filesystem's timestamp
+# resolution (up to 2 s on FAT/HFS+) would otherwise keep the same mtime and
+# reuse a stale hash. Same idea as git's "racily clean" index entries.
+_HASH_CACHE_RACY_NS = 2 * 10**9
+
+# Hash algorithms accepted by `package --hash-algo`. md5 is the data package
+# default and is written without a prefix; others are written as "<algo>:<hex>".
+HASH_ALGORITHMS = ("md5", "sha1", "sha256", "sha512", "blake2b", "blake3")
+
+# Metadata shared by every resource in datapackage.json. The nested dialect and
+# licenses objects are shared, not copied, between resources. Per-resource keys
+# are listed as None placeholders so they keep their position in the output.
+_DIALECT = {
+    "header": True,
+    "headerRows": [1],
+    "headerJoin": " ",
+    "commentChar": "#",
+    "delimiter": "\t",
+    "lineTerminator": "\r\n",
+    "quoteChar": "\"",
+    "doubleQuote": True,
+    "skipInitialSpace": False
+}
+_LICENSES = [
+    {
+        "name": "CC0",
+        "title": "Creative Commons CC0",
+        "path": "https://creativecommons.org/publicdomain/zero/1.0/"
+    }
+]
+_RESOURCE_BASE = {
+    "profile": "tabular-data-resource",
+    "name": None,
+    "path": None,
+    "format": "tsv",
+    "mediatype": "text/tab-separated-values",
+    "encoding": "utf-8",
+    "bytes": None,
+    "hash": None,
+    "schema": None,
+    "dialect": _DIALECT,
+    "licenses": _LICENSES,
+    "created": None
+}
+
+def _hash_factory(hash_algo):
+    """Return a callable creating a new hash object for hash_algo."""
+    if hash_algo == "blake3":
+        # blake3 hashes a single stream with SIMD and multiple threads.
+        return lambda: blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return lambda: hashlib.new(hash_algo)
+
+def _classify_file(name):
+    """
+    Return (file_type, inv_name) for a data/ file name, or None if it matches
+    no naming pattern. Plain substring/suffix tests pick the one pattern that
+    can match, so at most one regex runs for names that follow the conventions.
+    """
+    if "-source." in name:
+        m = _SOURCE_RE.match(name)
+        if m:
+            return 'source', m.group('inv')
+        # e.g. 'x-raw.csv-source.txt' contains '-source.' but is a raw file.
+        pattern, ftype = _RAW_RE, 'raw'
+    elif "-raw." in name:
+        pattern, ftype = _RAW_RE, 'raw'
+    elif name.endswith(".tsv"):
+        pattern, ftype = _TIDY_RE, 'tidy'
+    elif name.endswith(".yml"):
+        pattern, ftype = _SIDECAR_RE, 'sidecar'
+    else:
+        return None
+    m = pattern.match(name)
+    return (ftype, m.group('inv')) if m else None
+
+# Sidecars are parsed from worker threads, so the warn-once flag is locked.
+_slow_yaml_warning_lock = threading.Lock()
+_slow_yaml_warning_shown = False
+
+def _warn_slow_yaml_loader():
+    """Print the pure-Python YAML loader warning (once per process)."""
+    global _slow_yaml_warning_shown
+    with _slow_yaml_warning_lock:
+        if _slow_yaml_warning_shown:
+            return
+        _slow_yaml_warning_shown = True
+    print("Warning: PyYAML was built without libyaml; falling back to the slower pure-Python YAML loader.",
+          file=sys.stderr)
+
+@functools.lru_cache(maxsize=256)
+def _parse_yaml(path, mtime_ns, size):
+    """
+    Parse a YAML file. Cached on (path, mtime_ns, size) so each sidecar is
+    parsed once per process while it is unchanged; callers must not mutate
+    the returned object.
+    """
+    if _YamlLoader is not getattr(yaml, "CSafeLoader", None):
+        _warn_slow_yaml_loader()
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+def read_yaml(path):
+    """Load a YAML file, reusing an earlier parse if the file is unchanged."""
+    st = os.stat(path)
+    return _parse_yaml(path, st.st_mtime_ns, st.st_size)
 
 def check_project_structure(project_path, target_inv=None):
     """
     Check the project folder structure and file naming conventions.
     If target_inv is provided, only check that investigation.
-    Returns a list of error messages.
+    Returns (errors, parsed_sidecars): a list of error messages and a mapping
+    of investigation name to its parsed sidecar YAML, for reuse by
+    package_investigations.
     """
     errors = []
+    parsed_sidecars = {}
     # Check for README.md at project root.
     readme_path = os.path.join(project_path, "README.md")
     if not os.path.isfile(readme_path):
@@ -28,45 +180,32 @@ def check_project_structure(project_path, target_inv=None):
     data_path = os.path.join(project_path, "data")
     if not os.path.isdir(data_path):
         errors.append("Project must contain a data/ folder.")
-        return errors
-
-    # Ensure data/ contains only files.
-    for item in os.listdir(data_path):
-        item_full = os.path.join(data_path, item)
-        if os.path.isdir(item_full):
-            errors.append(f"data/ folder must only contain set-related files, but found subfolder: {item}")
-
-    # Define regex patterns for file types.
-    source_pattern    = re.compile(r'^(?P<inv>[A-Za-z0-9_]+)-source\..+$')
-    raw_pattern     = re.compile(r'^(?P<inv>[A-Za-z0-9_]+)-raw\..+$')
-    tidy_pattern    = re.compile(r'^(?P<inv>[A-Za-z0-9_]+)\.tsv$')
-    sidecar_pattern = re.compile(r'^(?P<inv>[A-Za-z0-9_]+)\.yml$')
-
-    # Group files by investigation name.
-    investigations = {}  # { inv_name: { 'source': [], 'raw': [], 'tidy': [], 'sidecar': [] } }
-    for file in os.listdir(data_path):
-        # Allow .gitignore and .DS_File to be present
-        if file in {".gitignore", ".DS_Store"}:
-            continue
-
-        file_path = os.path.join(data_path, file)
-        if not os.path.isfile(file_path):
-            continue
-
-        matched = False
-        for ftype, pattern in [('source', source_pattern),
-                               ('raw', raw_pattern),
-                               ('tidy', tidy_pattern),
-                               ('sidecar', sidecar_pattern)]:
-            m = pattern.match(file)
-            if m:
-                matched = True
-                inv_name = m.group('inv')
-                investigations.setdefault(inv_name, {'source': [], 'raw': [], 'tidy': [], 'sidecar': []})
-                investigations[inv_name][ftype].append(file)
-                break
-        if not matched:
-            errors.append(f"File '{file}' does not match any known naming pattern.")
+        return errors, parsed_sidecars
+
+    # Walk data/ once: reject subfolders and group files by investigation name.
+    # { inv_name: { 'source': [], 'raw': [], 'tidy': [], 'sidecar': [] } }, each a list of (name, path)
+    investigations = defaultdict(lambda: {'source': [], 'raw': [], 'tidy': [], 'sidecar': []})
+    with os.scandir(data_path) as it:
+        for entry in it:
+            file = entry.name
+            # Ensure data/ contains only files.
+            if entry.is_dir():
+                errors.append(f"data/ folder must only contain set-related files, but found subfolder: {file}")
+                continue
+
+            # Allow .gitignore and .DS_File to be present
+            if file in {".gitignore", ".DS_Store"}:
+                continue
+
+            if not entry.is_file():
+                continue
+
+            classified = _classify_file(file)
+            if classified is None:
+                errors.append(f"File '{file}' does not match any known naming pattern.")
+                continue
+            ftype, inv_name = classified
+            investigations[inv_name][ftype].append((file, entry.path))
 
     # If target investigation specified, filter the investigations.
     if target_inv:
@@ -79,7 +218,7 @@ def check_project_structure(project_path, target_inv=None):
     # Check each investigation.
     for inv, files_dict in investigations.items():
         # Investigation name must be alphanumeric (and underscores).
-        if not re.fullmatch(r"[A-Za-z0-9_]+", inv):
+        if not _INV_NAME_RE.fullmatch(inv):
             errors.append(f"Investigation name '{inv}' contains invalid characters. Only alphanumeric and '_' are allowed.")
 
         # Exactly one raw, tidy, and sidecar file must be present.
@@ -97,42 +236,60 @@ def check_project_structure(project_path, target_inv=None):
     # Optionally, check content of tidy and sidecar files.
     for inv, files_dict in investigations.items():
         if files_dict['tidy']:
-            tidy_file = files_dict['tidy'][0]
-            tidy_path = os.path.join(data_path, tidy_file)
+            tidy_file, tidy_path = files_dict['tidy'][0]
             try:
-                with open(tidy_path, encoding='utf-8') as f:
-                    header_line = f.readline()
-                    if "\t" not in header_line:
-                        errors.append(f"Tidy data file '{tidy_file}' does not appear to be tab-separated.")
+                # Raw fd read: no buffered-IO setup and no decoding beyond the header.
+                fd = os.open(tidy_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+                try:
+                    head = bytearray()
+                    line_end = None
+                    # Read until the first line ends, EOF, or the sniff limit.
+                    while line_end is None and len(head) < _TIDY_SNIFF_LIMIT:
+                        chunk = os.read(fd, _TIDY_SNIFF_SIZE)
+                        if not chunk:
+                            break
+                        m = _LINE_END_RE.search(chunk)
+                        if m:
+                            line_end = len(head) + m.start()
+                        head += chunk
+                finally:
+                    os.close(fd)
+                header_line = head[:line_end] if line_end is not None else head
+                # A header cut off at the sniff limit may end mid-character.
+                truncated = line_end is None and len(head) >= _TIDY_SNIFF_LIMIT
+                codecs.getincrementaldecoder('utf-8')().decode(header_line, final=not truncated)
+                if b"\t" not in header_line:
+                    errors.append(f"Tidy data file '{tidy_file}' does not appear to be tab-separated.")
             except UnicodeDecodeError:
                 errors.append(f"Tidy data file '{tidy_file}' is not encoded in UTF-8.")
             except Exception as e:
                 errors.append(f"Error reading tidy data file '{tidy_file}': {str(e)}")
 
         if files_dict['sidecar']:
-            sidecar_file = files_dict['sidecar'][0]
-            sidecar_path = os.path.join(data_path, sidecar_file)
+            sidecar_file, sidecar_path = files_dict['sidecar'][0]
             if yaml is not None:
                 try:
-                    with open(sidecar_path, 'r', encoding='utf-8') as f:
-                        yaml.safe_load(f)
+                    parsed_sidecars[inv] = read_yaml(sidecar_path)
                 except Exception as e:
                     errors.append(f"Sidecar file '{sidecar_file}' is not valid YAML: {str(e)}")
             else:
                 errors.append("PyYAML is not installed. Cannot check sidecar YAML files.")
 
-    return errors
+    return errors, parsed_sidecars
 
-def load_yaml_fields(yml_file):
+def load_yaml_fields(yml_file, yaml_data=None):
     """
     Load the YAML file and convert its mapping into a list of field definitions.
     Each YAML key becomes the 'name' attribute of the field.
+    If yaml_data is given it is used as the already-parsed content of yml_file.
     """
-    try:
-        with open(yml_file, "r", encoding="utf-8") as f:
-            yaml_data = yaml.safe_load(f)
-    except Exception as e:
-        sys.exit(f"Error loading YAML file {yml_file}: {e}")
+    if yaml_data is None:
+        if yaml is None:
+            sys.exit("Error: PyYAML is not installed. Cannot read sidecar YAML files.")
+        try:
+            yaml_data = read_yaml(yml_file)
+        except Exception as e:
+            sys.exit(f"Error loading YAML file {yml_file}: {e}")
 
     if not isinstance(yaml_data, dict):
         sys.exit(f"Error: Expected a YAML mapping at the root of {yml_file}")
@@ -147,23 +304,135 @@ def load_yaml_fields(yml_file):
         fields.append(new_field)
     return fields
 
-def compute_file_info(tsv_path):
-    """Compute file size in bytes and md5 hash for a given file."""
+def compute_file_info(tsv_path, hash_algo="md5"):
+    """Compute file size in bytes and hex digest (md5 by default) for a given file."""
     try:
         bytes_size = os.path.getsize(tsv_path)
     except Exception as e:
         sys.exit(f"Error obtaining file size for {tsv_path}: {e}")
 
-    md5_hash = hashlib.md5()
+    new_hash = _hash_factory(hash_algo)
     try:
         with open(tsv_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                md5_hash.update(chunk)
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: hashing loop runs in C.
+                file_hash = hashlib.file_digest(f, new_hash)
+            else:
+                # Reuse one buffer instead of allocating a bytes object per chunk.
+                file_hash = new_hash()
+                buf = memoryview(bytearray(_HASH_CHUNK_SIZE))
+                for n in iter(lambda: f.readinto(buf), 0):
+                    file_hash.update(buf[:n])
     except Exception as e:
-        sys.exit(f"Error computing md5 for {tsv_path}: {e}")
-    return bytes_size, md5_hash.hexdigest()
+        sys.exit(f"Error computing {hash_algo} for {tsv_path}: {e}")
+    return bytes_size, file_hash.hexdigest()
+
+def _orjson_compatible(obj):
+    """
+    Return True if orjson encodes obj exactly like json.dumps(indent=2).
+    Values the two encoders treat differently (strings with non-ASCII or DEL
+    characters, which json escapes as \\uXXXX; floats in exponent form or
+    non-finite; integers outside 64 bits; other dict key types; types json
+    cannot encode) make this False.
+    """
+    obj_type = type(obj)
+    if obj_type is str:
+        return obj.isascii() and "\x7f" not in obj
+    if obj_type is bool or obj is None:
+        return True
+    if obj_type is int:
+        return -2**63 <= obj < 2**64
+    if obj_type is float:
+        return math.isfinite(obj) and "e" not in repr(obj)
+    if obj_type is dict:
+        return all(
+            type(key) in (str, int, float, bool, type(None))
+            and _orjson_compatible(key) and _orjson_compatible(value)
+            for key, value in obj.items()
+        )
+    if obj_type is list or obj_type is tuple:
+        return all(_orjson_compatible(item) for item in obj)
+    return False
+
+def load_hash_cache(cache_file):
+    """Load the hash cache written by an earlier package run; {} if missing or unreadable."""
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_hash_cache(cache_file, cache):
+    """
+    Write the hash cache atomically, leaving out entries for files modified too
+    recently to trust their mtime; failure only costs re-hashing next time.
+    """
+    racy_after_ns = time.time_ns() - _HASH_CACHE_RACY_NS
+    cache = {path: entry for path, entry in cache.items()
+             if isinstance(entry, dict) and isinstance(entry.get("mtime_ns"), int)
+             and entry["mtime_ns"] < racy_after_ns}
+    tmp_file = cache_file + ".tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not write hash cache {cache_file}: {e}", file=sys.stderr)
 
-def package_investigations(target_inv=None):
+def cached_file_info(tsv_path, hash_algo="md5", hash_cache=None):
+    """
+    Like compute_file_info, but reuse the hash stored in hash_cache when the
+    file's size and mtime_ns match, and record newly computed hashes in it.
+    """
+    if hash_cache is None:
+        return compute_file_info(tsv_path, hash_algo)
+
+    # Stat before hashing: a write during hashing changes the mtime, so the
+    # next run misses the cache instead of trusting a stale hash.
+    try:
+        st = os.stat(tsv_path)
+    except Exception as e:
+        sys.exit(f"Error obtaining file size for {tsv_path}: {e}")
+    entry = hash_cache.get(tsv_path)
+    if not (isinstance(entry, dict)
+            and entry.get("size") == st.st_size
+            and entry.get("mtime_ns") == st.st_mtime_ns
+            and isinstance(entry.get("hashes"), dict)):
+        entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hashes": {}}
+    elif hash_algo in entry["hashes"]:
+        return st.st_size, entry["hashes"][hash_algo]
+
+    bytes_size, hash_hex = compute_file_info(tsv_path, hash_algo)
+    entry["hashes"][hash_algo] = hash_hex
+    hash_cache[tsv_path] = entry
+    return bytes_size, hash_hex
+
+def load_investigation(data_path, inv, yml_file, hash_algo="md5", hash_cache=None, yaml_data=None):
+    """
+    Collect the per-investigation values needed for a resource entry.
+    Returns (bytes_size, hash_hex, fields); placeholder size and hash are used
+    if data/<inv>.tsv does not exist. hash_cache is passed to cached_file_info,
+    yaml_data to load_yaml_fields.
+    """
+    # Construct TSV file path as data/<inv>.tsv.
+    tsv_path = os.path.join(data_path, f"{inv}.tsv")
+    if os.path.isfile(tsv_path):
+        bytes_size, hash_hex = cached_file_info(tsv_path, hash_algo, hash_cache)
+        if hash_algo != "md5":
+            hash_hex = f"{hash_algo}:{hash_hex}"
+    else:
+        print(f"Warning: TSV file '{tsv_path}' not found. Using placeholder values.", file=sys.stderr)
+        if hash_cache is not None:
+            hash_cache.pop(tsv_path, None)
+        bytes_size = 0
+        hash_hex = ""
+
+    # Load field definitions from the sidecar YAML.
+    fields = load_yaml_fields(yml_file, yaml_data)
+    return bytes_size, hash_hex, fields
+
+def package_investigations(target_inv=None, hash_algo="md5", parsed_sidecars=None):
     """
     Create a datapackage.json file at the top level.
     If target_inv is provided, package only that investigation;
@@ -172,24 +441,27 @@ def package_investigations(target_inv=None):
     For each investigation:
       - The resource name is inferred from the sidecar YAML filename.
       - The corresponding TSV file is expected at data/<name>.tsv.
-      - The file size and md5 hash are computed if the TSV file exists.
-      - The sidecar YAML file (input schema) is loaded and converted to a list of fields.
+      - The file size and hash (md5 unless hash_algo says otherwise) are computed
+        if the TSV file exists, reusing hashes from HASH_CACHE_FILE for unchanged files.
+      - The sidecar YAML file (input schema) is loaded and converted to a list of fields;
+        parsed_sidecars (as returned by check_project_structure) avoids re-parsing it.
       - Additional metadata (profile, format, mediatype, encoding, dialect, licenses, and created date)
         is added as per the original bash script.
     """
-    import os, sys, json, datetime
-
     project_path = os.getcwd()
     data_path = os.path.join(project_path, "data")
     if not os.path.isdir(data_path):
         sys.exit("Error: data/ folder not found in the current project directory.")
+    if hash_algo == "blake3" and blake3 is None:
+        sys.exit("Error: The blake3 package is not installed. Install it or choose another --hash-algo.")
 
     # Collect all sidecar YAML files in data/ folder.
     investigations = {}
-    for file in os.listdir(data_path):
-        if file.endswith(".yml"):
-            inv_name = os.path.splitext(file)[0]
-            investigations[inv_name] = os.path.join(data_path, file)
+    with os.scandir(data_path) as it:
+        for entry in it:
+            if entry.name.endswith(".yml"):
+                inv_name = os.path.splitext(entry.name)[0]
+                investigations[inv_name] = entry.path
 
     # If a target investigation is specified, filter the list.
     if target_inv:
@@ -199,53 +471,36 @@ def package_investigations(target_inv=None):
 
     resources = []
     # Use a single timestamp for all resources.
-    created = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    for inv, yml_file in investigations.items():
-        # Construct TSV file path as data/<inv>.tsv.
-        tsv_path = os.path.join(data_path, f"{inv}.tsv")
-        if os.path.isfile(tsv_path):
-            bytes_size, hash_hex = compute_file_info(tsv_path)
-        else:
-            print(f"Warning: TSV file '{tsv_path}' not found. Using placeholder values.", file=sys.stderr)
-            bytes_size = 0
-            hash_hex = ""
-
-        # Load field definitions from the sidecar YAML.
-        fields = load_yaml_fields(yml_file)
+    created = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    # Hash TSV files and load sidecars concurrently; hashing releases the GIL.
+    cache_file = os.path.join(project_path, HASH_CACHE_FILE)
+    hash_cache = load_hash_cache(cache_file)
+    parsed_sidecars = parsed_sidecars or {}
+    max_workers = min(8, os.cpu_count() or 1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {inv: executor.submit(load_investigation, data_path, inv, yml_file, hash_algo, hash_cache,
+                                         parsed_sidecars.get(inv))
+                   for inv, yml_file in investigations.items()}
+    for inv, future in futures.items():
+        bytes_size, hash_hex, fields = future.result()
 
         resource = {
-            "profile": "tabular-data-resource",
+            **_RESOURCE_BASE,
             "name": inv,
             "path": f"data/{inv}.tsv",
-            "format": "tsv",
-            "mediatype": "text/tab-separated-values",
-            "encoding": "utf-8",
             "bytes": bytes_size,
             "hash": hash_hex,
             "schema": {
                 "fields": fields
             },
-            "dialect": {
-                "header": True,
-                "headerRows": [1],
-                "headerJoin": " ",
-                "commentChar": "#",
-                "delimiter": "\t",
-                "lineTerminator": "\r\n",
-                "quoteChar": "\"",
-                "doubleQuote": True,
-                "skipInitialSpace": False
-            },
-            "licenses": [
-                {
-                    "name": "CC0",
-                    "title": "Creative Commons CC0",
-                    "path": "https://creativecommons.org/publicdomain/zero/1.0/"
-                }
-            ],
             "created": created
         }
         resources.append(resource)
+    if not target_inv:
+        # Every investigation was seen, so drop entries for files no longer packaged.
+        tsv_paths = {os.path.join(data_path, f"{inv}.tsv") for inv in investigations}
+        hash_cache = {path: entry for path, entry in hash_cache.items() if path in tsv_paths}
+    save_hash_cache(cache_file, hash_cache)
 
     # Use the current directory name as the package name.
     package_name = os.path.basename(os.path.abspath(project_path)) or "defaultdata-package"
@@ -256,29 +511,47 @@ def package_investigations(target_inv=None):
 
     out_file = os.path.join(project_path, "datapackage.json")
     try:
-        with open(out_file, "w", encoding="utf-8") as f:
-            json.dump(datapackage, f, indent=2)
+        # Both encoders give identical bytes; orjson is only used when it can.
+        if orjson is not None and _orjson_compatible(datapackage):
+            content = orjson.dumps(datapackage, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            content = json.dumps(datapackage, indent=2).encode("utf-8")
+        # Encode before opening so a failure leaves an existing file untouched.
+        with open(out_file, "wb") as f:
+            f.write(content)
         print(f"Created datapackage.json with {len(resources)} resource(s).")
     except Exception as e:
         sys.exit(f"Error writing datapackage.json: {e}")
 
-def cmd_check(args):
-    # The investigation (if given) is the first argument.
-    target_inv = args.investigation
-    project_folder = os.getcwd()
-    errors = check_project_structure(project_folder, target_inv)
+def report_check_results(errors):
+    """Print the check results; exit with status 1 if there are errors."""
     if errors:
         print("Validation errors found:")
         for err in errors:
             print(" - " + err)
         sys.exit(1)
-    else:
-        print("All checks passed.")
-        sys.exit(0)
+    print("All checks passed.")
+
+def cmd_check(args):
+    # The investigation (if given) is the first argument.
+    target_inv = args.investigation
+    project_folder = os.getcwd()
+    errors, _ = check_project_structure(project_folder, target_inv)
+    report_check_results(errors)
+    sys.exit(0)
 
 def cmd_package(args):
     target_inv = args.investigation
-    package_investigations(target_inv)
+    package_investigations(target_inv, args.hash_algo)
+    sys.exit(0)
+
+def cmd_build(args):
+    # Check first, then package reusing the sidecars parsed during the check.
+    target_inv = args.investigation
+    project_folder = os.getcwd()
+    errors, parsed_sidecars = check_project_structure(project_folder, target_inv)
+    report_check_results(errors)
+    package_investigations(target_inv, args.hash_algo, parsed_sidecars)
     sys.exit(0)
 
 def main():
@@ -287,6 +560,11 @@ def main():
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
+    # Options shared by the subcommands that write datapackage.json.
+    hash_parser = argparse.ArgumentParser(add_help=False)
+    hash_parser.add_argument("--hash-algo", choices=HASH_ALGORITHMS, default="md5",
+                             help="Algorithm used for the resource hash (default: md5; blake2b is faster, blake3 requires the blake3 package)")
+
     # 'check' subcommand: optional investigation name.
     check_parser = subparsers.add_parser("check", help="Check project folder structure.")
     check_parser.add_argument("investigation", nargs="?", default=None,
@@ -294,11 +572,19 @@ def main():
     check_parser.set_defaults(func=cmd_check)
 
     # 'package' subcommand: optional investigation name.
-    package_parser = subparsers.add_parser("package", help="Create datapackage.json from investigation sidecar YAML(s).")
+    package_parser = subparsers.add_parser("package", parents=[hash_parser],
+                                           help="Create datapackage.json from investigation sidecar YAML(s).")
     package_parser.add_argument("investigation", nargs="?", default=None,
                                 help="Investigation name (if omitted, all investigations are packaged)")
     package_parser.set_defaults(func=cmd_package)
 
+    # 'build' subcommand: check, then package if all checks pass.
+    build_parser = subparsers.add_parser("build", parents=[hash_parser],
+                                         help="Check project folder structure, then create datapackage.json.")
+    build_parser.add_argument("investigation", nargs="?", default=None,
+                              help="Investigation name (if omitted, all investigations are checked and packaged)")
+    build_parser.set_defaults(func=cmd_build)
+
     args = parser.parse_args()
     args.func(args)
 